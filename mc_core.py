@@ -0,0 +1,135 @@
+# Monte Carlo core for the project delivery method simulation. Pure NumPy (plus optional
+# Numba) with no Streamlit dependency, so the JIT kernels are compiled once per process
+# instead of being redefined on every script rerun.
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; simulate_mc() falls back to NumPy
+    njit = None
+
+# Normalize values to [0, 1] over the triangular support as offset + scale * value.
+# Time and cost are inverted (lower is better). The degenerate-range guard (min == max:
+# 0 if inverted, else 1) is resolved here once per metric, so the per-sample math has no branch.
+INVERT = np.array([True, True, False])  # time, cost, quality
+
+def normalization_coefficients(lows, highs, invert=INVERT):
+    spans = highs - lows
+    scales = np.divide(1.0, spans, out=np.zeros_like(spans), where=spans != 0)
+    offsets = np.where(spans != 0, -lows * scales, 1.0)
+    return np.where(invert, 1.0 - offsets, offsets), np.where(invert, -scales, scales)
+
+# Mean and population std along the last axis from the sum and sum of squares,
+# accumulated in float64 whatever the dtype of values
+def mean_std(values):
+    n = values.shape[-1]
+    mean = values.sum(axis=-1, dtype=np.float64) / n
+    var = np.einsum("...i,...i->...", values, values, dtype=np.float64) / n - mean * mean
+    return mean, np.sqrt(np.maximum(var, 0.0))
+
+# Triangular inverse CDF: maps uniforms in [0, 1) to triangular samples, written into out
+# (allocated like uniforms if not given) with in-place ufuncs and no full-size float temporaries.
+# The branch test u < (mode - low) / span is written without the division so min == max needs
+# no guard. Pass float32 parameters to keep the whole computation in float32.
+def triangular_ppf(uniforms, lows, modes, highs, out=None):
+    if out is None:
+        out = np.empty_like(uniforms)
+    spans = highs - lows
+    np.multiply(uniforms, spans, out=out)
+    left = out < modes - lows
+    right = ~left
+    # Left branch: low + sqrt(u * span * (mode - low))
+    np.multiply(out, modes - lows, out=out, where=left)
+    # Right branch: high - sqrt((1 - u) * span * (high - mode))
+    np.subtract(1.0, uniforms, out=out, where=right)
+    np.multiply(out, spans, out=out, where=right)
+    np.multiply(out, highs - modes, out=out, where=right)
+    np.sqrt(out, out=out)
+    np.add(lows, out, out=out, where=left)
+    np.subtract(highs, out, out=out, where=right)
+    return out
+
+# Fused sampling + normalization + weighted score, one pass over the uniforms and no
+# temporaries: scores are never stored. Instead it accumulates score sum and sum of squares
+# (the same moments mean_std() uses) and the time and cost sums, so no summary needs a second pass.
+if njit is not None:
+    @njit(fastmath=True, cache=True)
+    def triangular_ppf_scalar(u, low, mode, high):
+        span = high - low
+        if u * span < mode - low:
+            return low + np.sqrt(u * span * (mode - low))
+        return high - np.sqrt((1.0 - u) * span * (high - mode))
+
+    @njit(fastmath=True, cache=True)
+    def score_kernel(uniforms, lows, modes, highs, offsets, scales, weight_vec,
+                     mean_scores, std_devs, mean_times, mean_costs):
+        iterations = uniforms.shape[2]
+        for m in range(uniforms.shape[0]):
+            score_sum = 0.0
+            score_sq_sum = 0.0
+            time_sum = 0.0
+            cost_sum = 0.0
+            for i in range(iterations):
+                time = triangular_ppf_scalar(uniforms[m, 0, i], lows[m, 0], modes[m, 0], highs[m, 0])
+                cost = triangular_ppf_scalar(uniforms[m, 1, i], lows[m, 1], modes[m, 1], highs[m, 1])
+                quality = triangular_ppf_scalar(uniforms[m, 2, i], lows[m, 2], modes[m, 2], highs[m, 2])
+                time_sum += time
+                cost_sum += cost
+
+                norm_time = offsets[m, 0] + scales[m, 0] * time
+                norm_cost = offsets[m, 1] + scales[m, 1] * cost
+                norm_quality = offsets[m, 2] + scales[m, 2] * quality
+                score = np.float64(
+                    norm_time * norm_time * weight_vec[0] +  # Stronger penalty
+                    norm_cost * weight_vec[1] +
+                    norm_quality * weight_vec[2]
+                )
+                score_sum += score
+                score_sq_sum += score * score
+            mean_scores[m] = score_sum / iterations
+            std_devs[m] = np.sqrt(max(score_sq_sum / iterations - mean_scores[m] ** 2, 0.0))
+            mean_times[m] = time_sum / iterations
+            mean_costs[m] = cost_sum / iterations
+
+# Simulate every delivery method and summarize its scores.
+# triangles is (methods, metrics, [min, most likely, max]) with metrics ordered time, cost, quality.
+# Uniforms, samples and scores are float32: scores are in [0, 1] and only shown to 3 decimals.
+# The NumPy path gets float32 parameters so its inverse CDF and scoring stay in float32 end to
+# end; the Numba kernel reads the float32 uniforms but does its scalar math in float64.
+# Returns only the per-method mean score, std, mean time and mean cost. The NumPy path builds a
+# (methods, iterations) score matrix for mean_std() and drops it; the Numba path never builds one.
+def simulate_mc(triangles, weight_vec, iterations, seed):
+    triangles = np.asarray(triangles, dtype=np.float64)
+    lows, modes, highs = (triangles[..., k] for k in range(3))
+    if np.any(lows > modes) or np.any(modes > highs):
+        raise ValueError("Each input needs Min <= Most Likely <= Max.")
+
+    # One float32 uniform per method, metric and iteration: (methods, metrics, iterations). Each
+    # method gets an independent PCG64 stream spawned from the seed. Both paths below turn the
+    # uniforms into triangular samples the same way, so they agree for a seed.
+    uniforms = np.empty((*lows.shape, iterations), dtype=np.float32)
+    for m, child_seed in enumerate(np.random.SeedSequence(seed).spawn(len(triangles))):
+        np.random.default_rng(child_seed).random(dtype=np.float32, out=uniforms[m])
+
+    lows32, modes32, highs32 = (p.astype(np.float32) for p in (lows, modes, highs))
+    offsets, scales = normalization_coefficients(lows32, highs32)
+    if njit is not None:
+        mean_scores, std_devs, mean_times, mean_costs = np.empty((4, len(triangles)))
+        score_kernel(uniforms, lows, modes, highs, offsets, scales, weight_vec,
+                     mean_scores, std_devs, mean_times, mean_costs)
+        return mean_scores, std_devs, mean_times, mean_costs
+
+    draws = triangular_ppf(uniforms, lows32[..., None], modes32[..., None], highs32[..., None])
+    mean_times = draws[:, 0].mean(axis=-1, dtype=np.float64)
+    mean_costs = draws[:, 1].mean(axis=-1, dtype=np.float64)
+
+    # Corrected Normalization: Stronger penalty for high time (in place on the draws)
+    draws *= scales[..., None]
+    draws += offsets[..., None]
+    np.square(draws[:, 0], out=draws[:, 0])  # Stronger penalty
+
+    # Weighted score as a single batched matrix-vector product
+    all_scores = np.empty((len(triangles), iterations), dtype=np.float32)
+    np.matmul(weight_vec, draws, out=all_scores)
+    mean_scores, std_devs = mean_std(all_scores)
+    return mean_scores, std_devs, mean_times, mean_costs
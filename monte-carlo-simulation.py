@@ -1,8 +1,12 @@
 import numpy as np
 import pandas as pd
-import plotly.graph_objects as go
 import streamlit as st
-from scipy.stats import ttest_ind
+from scipy.stats import t as student_t
+
+from mc_core import simulate_mc
+
+# Default seed for the random number generator, so a given set of inputs always produces the same draws
+SEED = 12345
 
 # Streamlit App Title
 st.title("Monte Carlo Simulation for Project Delivery Method Selection")
@@ -10,18 +14,15 @@ st.title("Monte Carlo Simulation for Project Delivery Method Selection")
 # Sidebar for User Inputs
 st.sidebar.header("Simulation Parameters")
 iterations = st.sidebar.number_input("Number of Simulations", min_value=100, step=100, value=10000)
+seed = st.sidebar.number_input("Random Seed", min_value=0, step=1, value=SEED)
 
 st.sidebar.header("Weight Assignments (Total 100%)")
 time_weight = st.sidebar.number_input("Weight for Time (%)", min_value=0, max_value=100, value=60)
 cost_weight = st.sidebar.number_input("Weight for Cost (%)", min_value=0, max_value=100, value=20)
 quality_weight = st.sidebar.number_input("Weight for Quality (%)", min_value=0, max_value=100, value=20)
 
-# Normalize Weights
-weights = {
-    "time": time_weight / 100,
-    "cost": cost_weight / 100,
-    "quality": quality_weight / 100,
-}
+# Normalize Weights into the (time, cost, quality) vector the simulation consumes
+weight_vec = np.array([time_weight, cost_weight, quality_weight], dtype=np.float32) / 100
 
 # Function to get user inputs
 def get_user_input(method_name, color):
@@ -60,83 +61,64 @@ methods = {
     "Construction Manager at Risk (CMAR)": get_user_input("Construction Manager at Risk (CMAR)", "red"),
 }
 
+# Simulate every delivery method (see mc_core.simulate_mc).
+# Cached across reruns on (methods, iterations, weights, seed); the generators are built
+# from the seed inside, so the key fully determines the result. Bounded so a long-running
+# server does not keep one entry per input tweak forever.
+@st.cache_data(show_spinner=False, max_entries=32)
+def simulate(methods, iterations, weight_vec, seed):
+    # (methods, metrics, [min, most likely, max])
+    triangles = [[params["time"], params["cost"], params["quality"]] for params in methods.values()]
+    return simulate_mc(triangles, weight_vec, iterations, seed)
+
 # Monte Carlo Simulation
 st.header("Running Monte Carlo Simulation...")
-results = []
-scores_dict = {}
-time_results = {}
-cost_results = {}
-
-for method, params in methods.items():
-    scores = []
-    times = []
-    costs = []
-
-    for _ in range(iterations):
-        time = np.random.triangular(*params["time"])
-        cost = np.random.triangular(*params["cost"])
-        quality = np.random.triangular(*params["quality"])
-
-        times.append(time)
-        costs.append(cost)
-
-        # Corrected Normalization: Stronger penalty for high time
-        def normalize(value, min_val, max_val, invert=False):
-            if max_val == min_val:
-                return 0 if invert else 1  
-            norm_value = (value - min_val) / (max_val - min_val)
-            return 1 - norm_value if invert else norm_value
-
-        norm_time = normalize(time, params["time"][0], params["time"][2], invert=True) ** 2  # Stronger penalty
-        norm_cost = normalize(cost, params["cost"][0], params["cost"][2], invert=True)
-        norm_quality = normalize(quality, params["quality"][0], params["quality"][2])
-
-        score = (
-            norm_time * weights["time"] +
-            norm_cost * weights["cost"] +
-            norm_quality * weights["quality"]
-        )
-        scores.append(score)
-
-    results.append({
+mean_scores, std_devs, mean_times, mean_costs = simulate(methods, iterations, weight_vec, seed)
+
+results = [
+    {
         "method": method,
-        "scores": scores,
-        "mean_score": np.mean(scores),
-        "std_dev": np.std(scores),
-        "mean_time": np.mean(times),
-        "mean_cost": np.mean(costs),
-    })
-
-    scores_dict[method] = scores
-    time_results[method] = times
-    cost_results[method] = costs
-
-# Convert results into a DataFrame
-df_results = pd.DataFrame(results).drop(columns=["scores"])
+        "mean_score": mean_scores[m],
+        "std_dev": std_devs[m],
+        "mean_time": mean_times[m],
+        "mean_cost": mean_costs[m],
+    }
+    for m, method in enumerate(methods)
+]
+
+# Streamlit renders the list of row dicts directly; no intermediate DataFrame
 st.subheader("Simulation Results")
-st.dataframe(df_results)
+st.dataframe(results)
 
 # Statistical Significance (p-values)
 st.subheader("Statistical Significance (p-values from t-tests)")
-p_values = pd.DataFrame(index=methods.keys(), columns=methods.keys())
-
-for method1 in methods.keys():
-    for method2 in methods.keys():
-        if method1 != method2:
-            t_stat, p_value = ttest_ind(scores_dict[method1], scores_dict[method2])
-            p_values.loc[method1, method2] = round(p_value, 4)
-        else:
-            p_values.loc[method1, method2] = "-"
-
-st.dataframe(p_values)
+method_names = list(methods.keys())
+n = iterations
+# Sample variances (ddof=1) from the stds already computed; no second pass over the scores
+score_vars = std_devs ** 2 * n / (n - 1)
+
+# Student's t-test with pooled variance (ttest_ind default), equal sample sizes.
+# The table is symmetric, so only the upper triangle is computed and then mirrored.
+rows, cols = np.triu_indices(len(method_names), k=1)
+with np.errstate(divide="ignore", invalid="ignore"):
+    t_stats = (mean_scores[rows] - mean_scores[cols]) / np.sqrt((score_vars[rows] + score_vars[cols]) / n)
+p_matrix = np.full((len(method_names), len(method_names)), np.nan)
+p_matrix[rows, cols] = p_matrix[cols, rows] = 2 * student_t.sf(np.abs(t_stats), 2 * n - 2)
+# The table stays float64; "-" on the diagonal is display formatting only
+p_values = pd.DataFrame(p_matrix, index=method_names, columns=method_names)
+
+st.dataframe(p_values.style.format("{:.4f}", na_rep="-"))
 
 # Practical Significance
 st.subheader("Practical Significance (Time & Cost Impact)")
-best_method = df_results.loc[df_results["mean_score"].idxmax()]
-for _, method in df_results.iterrows():
-    if method["method"] != best_method["method"]:
-        time_diff = method["mean_time"] - best_method["mean_time"]
-        cost_diff = method["mean_cost"] - best_method["mean_cost"]
+best_index = int(np.argmax(mean_scores))
+best_method = results[best_index]
+time_diffs = mean_times - mean_times[best_index]
+cost_diffs = mean_costs - mean_costs[best_index]
+for m, method in enumerate(results):
+    if m != best_index:
+        time_diff = time_diffs[m]
+        cost_diff = cost_diffs[m]
 
         st.write(f"Comparison: **{best_method['method']} vs. {method['method']}**")
         if time_diff > 0: